@@ -1,9 +1,7 @@
 import asyncio
 import logging
 
-from decouple import config as dconfig
 from fastapi import FastAPI, Request
-from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import HTTPException
 from fastapi_plugins import (
     RedisSettings,
@@ -29,7 +27,11 @@ from app.repositories.bitcoin import (
     register_bitcoin_status_gatherer,
     register_bitcoin_zmq_sub,
 )
-from app.repositories.lightning import initialize_ln_repo, register_lightning_listener
+from app.repositories.lightning import (
+    initialize_ln_repo,
+    register_lightning_listener,
+    unregister_lightning_listener,
+)
 from app.repositories.system import get_hardware_info, register_hardware_info_gatherer
 from app.repositories.utils import (
     get_bitcoin_client_warmup_data,
@@ -37,11 +39,24 @@ from app.repositories.utils import (
     get_full_client_warmup_data_bitcoinonly,
 )
 from app.routers import apps, bitcoin, lightning, setup, system
+from app.settings import get_settings
 from app.utils import SSE, broadcast_sse_msg, build_sse_event, sse_mgr
 
+try:
+    import uvloop
+
+    # All hot paths (SSE fan-out, gRPC streams, the listener coalescing
+    # windows) are asyncio bound; uvloop makes every task switch and
+    # timer cheaper. uvicorn's "auto" loop picks it up as well, this
+    # covers running the app under a plain asyncio entry point.
+    uvloop.install()
+except ImportError:
+    # uvloop is not available on Windows
+    pass
+
 logging.basicConfig(level=logging.WARNING)
 
-node_type = dconfig("ln_node")
+node_type = get_settings().ln_node
 
 
 @registered_configuration
@@ -86,7 +101,7 @@ async def on_startup():
     await redis_plugin.init_app(app, config=config)
     await redis_plugin.init()
     register_cookie_updater()
-    await broadcast_sse_msg(SSE.SYSTEM_STARTUP_INFO, api_startup_status.dict())
+    await broadcast_sse_msg(SSE.SYSTEM_STARTUP_INFO, api_startup_status)
 
     loop = asyncio.get_event_loop()
     loop.create_task(_initialize_bitcoin())
@@ -118,7 +133,7 @@ async def _set_startup_status(
 
     loop = asyncio.get_event_loop()
     loop.create_task(warmup_new_connections())
-    await broadcast_sse_msg(SSE.SYSTEM_STARTUP_INFO, api_startup_status.dict())
+    await broadcast_sse_msg(SSE.SYSTEM_STARTUP_INFO, api_startup_status)
 
 
 async def _initialize_bitcoin():
@@ -187,6 +202,7 @@ async def _initialize_lightning():
 
 @app.on_event("shutdown")
 async def on_shutdown() -> None:
+    await unregister_lightning_listener()
     await redis_plugin.terminate()
     remove_local_cookie()
 
@@ -231,9 +247,7 @@ async def stream(request: Request):
     event_source, id = sse_mgr.add_connection(request)
     new_connections.append(id)
 
-    await _send_sse_event(
-        id, SSE.SYSTEM_STARTUP_INFO, jsonable_encoder(api_startup_status.dict())
-    )
+    await _send_sse_event(id, SSE.SYSTEM_STARTUP_INFO, api_startup_status)
 
     loop = asyncio.get_event_loop()
     loop.create_task(warmup_new_connections())
@@ -271,12 +285,12 @@ async def warmup_new_connections():
             for id in new_connections:
                 await asyncio.gather(
                     *[
-                        _send_sse_event(id, SSE.SYSTEM_INFO, res[0].dict()),
-                        _send_sse_event(id, SSE.BTC_INFO, res[1].dict()),
-                        _send_sse_event(id, SSE.LN_INFO, res[2].dict()),
-                        _send_sse_event(id, SSE.LN_INFO_LITE, res[3].dict()),
+                        _send_sse_event(id, SSE.SYSTEM_INFO, res[0]),
+                        _send_sse_event(id, SSE.BTC_INFO, res[1]),
+                        _send_sse_event(id, SSE.LN_INFO, res[2]),
+                        _send_sse_event(id, SSE.LN_INFO_LITE, res[3]),
                         _send_sse_event(id, SSE.LN_FEE_REVENUE, res[4]),
-                        _send_sse_event(id, SSE.WALLET_BALANCE, res[5].dict()),
+                        _send_sse_event(id, SSE.WALLET_BALANCE, res[5]),
                         _send_sse_event(id, SSE.HARDWARE_INFO, res[6]),
                     ]
                 )
@@ -288,8 +302,8 @@ async def warmup_new_connections():
             for id in new_connections:
                 await asyncio.gather(
                     *[
-                        _send_sse_event(id, SSE.SYSTEM_INFO, res[0].dict()),
-                        _send_sse_event(id, SSE.BTC_INFO, res[1].dict()),
+                        _send_sse_event(id, SSE.SYSTEM_INFO, res[0]),
+                        _send_sse_event(id, SSE.BTC_INFO, res[1]),
                         _send_sse_event(id, SSE.HARDWARE_INFO, res[2]),
                     ]
                 )
@@ -304,7 +318,7 @@ async def warmup_new_connections():
         for id in new_connections:
             await asyncio.gather(
                 *[
-                    _send_sse_event(id, SSE.BTC_INFO, res[0].dict()),
+                    _send_sse_event(id, SSE.BTC_INFO, res[0]),
                     _send_sse_event(id, SSE.HARDWARE_INFO, res[1]),
                 ]
             )
@@ -1,14 +1,20 @@
 import asyncio
+import importlib
 import logging
-from typing import AsyncGenerator, List, Optional
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncGenerator, Awaitable, Callable, List, Optional, Protocol
 
-from decouple import config
 from fastapi import status
 from fastapi.exceptions import HTTPException
+from fastapi_plugins import redis_plugin
 
 from app.models.lightning import (
     Channel,
     FeeRevenue,
+    ForwardSuccessEvent,
     GenericTx,
     InitLnRepoUpdate,
     Invoice,
@@ -20,19 +26,220 @@ from app.models.lightning import (
     PaymentRequest,
     SendCoinsInput,
     SendCoinsResponse,
+    WalletBalance,
 )
 from app.models.system import APIPlatform
-from app.utils import SSE, broadcast_sse_msg, redis_get
+from app.settings import get_settings
+from app.utils import SSE, TTLCache, broadcast_sse_msg, redis_get, subscribers_present
 
-PLATFORM = config("platform", cast=str)
+_settings = get_settings()
 
-ln_node = config("ln_node")
-if ln_node == "lnd_grpc":
-    import app.repositories.ln_impl.lnd_grpc as ln
-elif ln_node == "cln_grpc" and PLATFORM != APIPlatform.RASPIBLITZ:
-    import app.repositories.ln_impl.cln_grpc as ln
-elif ln_node == "cln_grpc" and PLATFORM == APIPlatform.RASPIBLITZ:
-    import app.repositories.ln_impl.specializations.cln_grpc_blitz as ln
+PLATFORM = _settings.platform
+
+ln_node = _settings.ln_node
+
+# Module path per backend; the module is only imported when its backend
+# is actually configured, so a bitcoin-only node never pays the grpc
+# import cost.
+_BACKENDS = {
+    "lnd_grpc": "app.repositories.ln_impl.lnd_grpc",
+    "cln_grpc": "app.repositories.ln_impl.cln_grpc",
+}
+
+# RaspiBlitz ships its own CLN specialization
+if PLATFORM == APIPlatform.RASPIBLITZ:
+    _BACKENDS["cln_grpc"] = "app.repositories.ln_impl.specializations.cln_grpc_blitz"
+
+GATHER_INFO_INTERVALL = _settings.gather_ln_info_interval
+
+_CACHE = {"wallet_balance": None, "version": 0}
+
+# Short-TTL read cache. Polling clients often request the same data
+# several times per second; this collapses those into one gRPC call.
+_ttl_cache = TTLCache()
+
+WALLET_BALANCE_CACHE_TTL = 1.0
+
+# The wallet balance is additionally cached in Redis so that multiple
+# API workers share one value instead of each polling the node. Updates
+# are fanned out over pub/sub; every worker rebroadcasts them to its
+# own SSE clients.
+_WALLET_BALANCE_REDIS_KEY = "ln:wallet_balance"
+_WALLET_BALANCE_REDIS_CHANNEL = "ln:wallet_balance:updates"
+_WALLET_BALANCE_REDIS_TTL = 5
+
+ENABLE_FWD_NOTIFICATIONS = _settings.sse_notify_forward_successes
+
+FWD_GATHER_INTERVAL = _settings.forwards_gather_interval
+
+
+if FWD_GATHER_INTERVAL < 0.3:
+    raise RuntimeError("forwards_gather_interval cannot be less than 0.3 seconds")
+
+
+class LNBackend(Protocol):
+    """Interface every node backend in ln_impl must implement."""
+
+    def initialize_impl(self) -> AsyncGenerator[InitLnRepoUpdate, None]:
+        ...
+
+    async def get_ln_info_impl(self) -> LnInfo:
+        ...
+
+    async def get_wallet_balance_impl(self) -> WalletBalance:
+        ...
+
+    async def list_all_tx_impl(
+        self, successful_only: bool, index_offset: int, max_tx: int, reversed: bool
+    ) -> List[GenericTx]:
+        ...
+
+    async def list_invoices_impl(
+        self,
+        pending_only: bool,
+        index_offset: int,
+        num_max_invoices: int,
+        reversed: bool,
+    ) -> List[Invoice]:
+        ...
+
+    async def list_on_chain_tx_impl(self) -> List[OnChainTransaction]:
+        ...
+
+    async def list_payments_impl(
+        self,
+        include_incomplete: bool,
+        index_offset: int,
+        max_payments: int,
+        reversed: bool,
+    ) -> List[Payment]:
+        ...
+
+    async def add_invoice_impl(
+        self, memo: str, value_msat: int, expiry: int, is_keysend: bool
+    ) -> Invoice:
+        ...
+
+    async def decode_pay_request_impl(self, pay_req: str) -> PaymentRequest:
+        ...
+
+    async def new_address_impl(self, input: NewAddressInput) -> str:
+        ...
+
+    async def send_coins_impl(self, input: SendCoinsInput) -> SendCoinsResponse:
+        ...
+
+    async def send_payment_impl(
+        self,
+        pay_req: str,
+        timeout_seconds: int,
+        fee_limit_msat: int,
+        amount_msat: Optional[int],
+    ) -> Payment:
+        ...
+
+    async def channel_open_impl(
+        self, local_funding_amount: int, node_URI: str, target_confs: int
+    ) -> str:
+        ...
+
+    async def channel_list_impl(self) -> List[Channel]:
+        ...
+
+    async def channel_close_impl(self, channel_id: int, force_close: bool) -> str:
+        ...
+
+    async def get_fee_revenue_impl(self) -> FeeRevenue:
+        ...
+
+    async def unlock_wallet_impl(self, password: str) -> bool:
+        ...
+
+    def listen_info_impl(self) -> AsyncGenerator[LnInfo, None]:
+        ...
+
+    def listen_invoices(self) -> AsyncGenerator[Invoice, None]:
+        ...
+
+    def listen_forward_events(self) -> AsyncGenerator[ForwardSuccessEvent, None]:
+        ...
+
+
+@dataclass
+class _Impl:
+    """Backend functions resolved once at import time.
+
+    The hot async wrappers below forward thousands of calls; binding the
+    implementations here avoids a module attribute lookup on every call.
+    """
+
+    initialize: Callable[..., AsyncGenerator[InitLnRepoUpdate, None]]
+    get_ln_info: Callable[..., Awaitable[LnInfo]]
+    get_wallet_balance: Callable[..., Awaitable[WalletBalance]]
+    list_all_tx: Callable[..., Awaitable[List[GenericTx]]]
+    list_invoices: Callable[..., Awaitable[List[Invoice]]]
+    list_on_chain_tx: Callable[..., Awaitable[List[OnChainTransaction]]]
+    list_payments: Callable[..., Awaitable[List[Payment]]]
+    add_invoice: Callable[..., Awaitable[Invoice]]
+    decode_pay_request: Callable[..., Awaitable[PaymentRequest]]
+    new_address: Callable[..., Awaitable[str]]
+    send_coins: Callable[..., Awaitable[SendCoinsResponse]]
+    send_payment: Callable[..., Awaitable[Payment]]
+    channel_open: Callable[..., Awaitable[str]]
+    channel_list: Callable[..., Awaitable[List[Channel]]]
+    channel_close: Callable[..., Awaitable[str]]
+    get_fee_revenue: Callable[..., Awaitable[FeeRevenue]]
+    unlock_wallet: Callable[..., Awaitable[bool]]
+    listen_info: Callable[..., AsyncGenerator[LnInfo, None]]
+    listen_invoices: Callable[..., AsyncGenerator[Invoice, None]]
+    listen_forward_events: Callable[..., AsyncGenerator[ForwardSuccessEvent, None]]
+
+
+def _build_impl(backend: LNBackend) -> _Impl:
+    return _Impl(
+        initialize=backend.initialize_impl,
+        get_ln_info=backend.get_ln_info_impl,
+        get_wallet_balance=backend.get_wallet_balance_impl,
+        list_all_tx=backend.list_all_tx_impl,
+        list_invoices=backend.list_invoices_impl,
+        list_on_chain_tx=backend.list_on_chain_tx_impl,
+        list_payments=backend.list_payments_impl,
+        add_invoice=backend.add_invoice_impl,
+        decode_pay_request=backend.decode_pay_request_impl,
+        new_address=backend.new_address_impl,
+        send_coins=backend.send_coins_impl,
+        send_payment=backend.send_payment_impl,
+        channel_open=backend.channel_open_impl,
+        channel_list=backend.channel_list_impl,
+        channel_close=backend.channel_close_impl,
+        get_fee_revenue=backend.get_fee_revenue_impl,
+        unlock_wallet=backend.unlock_wallet_impl,
+        listen_info=backend.listen_info_impl,
+        listen_invoices=backend.listen_invoices,
+        listen_forward_events=backend.listen_forward_events,
+    )
+
+
+class _NoopBackend:
+    """Stands in when lightning is disabled.
+
+    Keeps _IMPL always bound so a stray call fails with a clean 501
+    instead of an AttributeError - without importing any grpc stack.
+    """
+
+    def __getattr__(self, name):
+        def _disabled(*args, **kwargs):
+            raise HTTPException(
+                status.HTTP_501_NOT_IMPLEMENTED,
+                detail="lightning is disabled on this node",
+            )
+
+        return _disabled
+
+
+_IMPL: _Impl = _build_impl(_NoopBackend())
+if ln_node in _BACKENDS:
+    _IMPL = _build_impl(importlib.import_module(_BACKENDS[ln_node]))
 elif ln_node == "none":
     logging.info(f"lightning was explicitly turned off")
 elif ln_node == "":
@@ -40,45 +247,105 @@ elif ln_node == "":
 else:
     logging.error(f"unknown lightning node: {ln_node}")
 
-GATHER_INFO_INTERVALL = config("gather_ln_info_interval", default=2, cast=float)
 
-_CACHE = {"wallet_balance": None}
+async def initialize_ln_repo() -> AsyncGenerator[InitLnRepoUpdate, None]:
+    async for u in _IMPL.initialize():
+        yield u
 
-ENABLE_FWD_NOTIFICATIONS = config(
-    "sse_notify_forward_successes", default=False, cast=bool
-)
 
-FWD_GATHER_INTERVAL = config("forwards_gather_interval", default=2.0, cast=float)
+_lite_cache_fp: Optional[int] = None
+_lite_cache: Optional[LightningInfoLite] = None
 
 
-if FWD_GATHER_INTERVAL < 0.3:
-    raise RuntimeError("forwards_gather_interval cannot be less than 0.3 seconds")
+def _lninfo_to_lite(info: LnInfo) -> LightningInfoLite:
+    # Single-slot memo: in the steady state the same LnInfo gets
+    # converted over and over (listener tick + HTTP reads), so skip the
+    # pydantic model construction when the source did not change.
+    global _lite_cache_fp
+    global _lite_cache
 
+    fp = info.fingerprint()
+    if _lite_cache is not None and _lite_cache_fp == fp:
+        return _lite_cache
 
-async def initialize_ln_repo() -> AsyncGenerator[InitLnRepoUpdate, None]:
-    async for u in ln.initialize_impl():
-        yield u
+    lite = LightningInfoLite.from_lninfo(info)
+    _lite_cache_fp = fp
+    _lite_cache = lite
+    return lite
+
+
+_ln_info_inflight: Optional[asyncio.Future] = None
+
+
+async def _get_ln_info_coalesced() -> LnInfo:
+    """Single-flight wrapper around the backend's get_ln_info call.
+
+    Concurrent callers share one in-flight gRPC request instead of each
+    issuing their own.
+    """
+
+    global _ln_info_inflight
+
+    if _ln_info_inflight is not None:
+        return await asyncio.shield(_ln_info_inflight)
+
+    _ln_info_inflight = asyncio.get_running_loop().create_future()
+    try:
+        info = await _IMPL.get_ln_info()
+    except BaseException as e:
+        _ln_info_inflight.set_exception(e)
+        # mark the exception as retrieved in case no one else is waiting
+        _ln_info_inflight.exception()
+        raise
+    else:
+        _ln_info_inflight.set_result(info)
+        return info
+    finally:
+        _ln_info_inflight = None
+
+
+async def _get_ln_info_cached() -> LnInfo:
+    return await _ttl_cache.get(
+        "ln_info", _get_ln_info_coalesced, GATHER_INFO_INTERVALL
+    )
 
 
 async def get_ln_info_lite() -> LightningInfoLite:
-    ln_info = await ln.get_ln_info_impl()
-    return LightningInfoLite.from_lninfo(ln_info)
+    ln_info = await _get_ln_info_cached()
+    return _lninfo_to_lite(ln_info)
+
+
+async def _wallet_balance_from_redis() -> WalletBalance:
+    redis = redis_plugin.redis
+    cached = await redis.get(_WALLET_BALANCE_REDIS_KEY)
+    if cached:
+        return WalletBalance.parse_raw(cached)
+
+    wb = await _IMPL.get_wallet_balance()
+    # NX: only the first worker per TTL window writes the key; a worker
+    # that lost the race still returns its equally fresh value.
+    await redis.set(
+        _WALLET_BALANCE_REDIS_KEY, wb.json(), ex=_WALLET_BALANCE_REDIS_TTL, nx=True
+    )
+    return wb
 
 
 async def get_wallet_balance():
-    return await ln.get_wallet_balance_impl()
+    return await _ttl_cache.get(
+        "wallet_balance", _wallet_balance_from_redis, WALLET_BALANCE_CACHE_TTL
+    )
 
 
 async def list_all_tx(
     successful_only: bool, index_offset: int, max_tx: int, reversed: bool
 ) -> List[GenericTx]:
-    return await ln.list_all_tx_impl(successful_only, index_offset, max_tx, reversed)
+    return await _IMPL.list_all_tx(successful_only, index_offset, max_tx, reversed)
 
 
 async def list_invoices(
     pending_only: bool, index_offset: int, num_max_invoices: int, reversed: bool
 ) -> List[Invoice]:
-    return await ln.list_invoices_impl(
+    return await _IMPL.list_invoices(
         pending_only,
         index_offset,
         num_max_invoices,
@@ -87,13 +354,13 @@ async def list_invoices(
 
 
 async def list_on_chain_tx() -> List[OnChainTransaction]:
-    return await ln.list_on_chain_tx_impl()
+    return await _IMPL.list_on_chain_tx()
 
 
 async def list_payments(
     include_incomplete: bool, index_offset: int, max_payments: int, reversed: bool
 ) -> List[Payment]:
-    return await ln.list_payments_impl(
+    return await _IMPL.list_payments(
         include_incomplete, index_offset, max_payments, reversed
     )
 
@@ -101,19 +368,30 @@ async def list_payments(
 async def add_invoice(
     value_msat: int, memo: str = "", expiry: int = 3600, is_keysend: bool = False
 ) -> Invoice:
-    return await ln.add_invoice_impl(memo, value_msat, expiry, is_keysend)
+    return await _IMPL.add_invoice(memo, value_msat, expiry, is_keysend)
 
 
 async def decode_pay_request(pay_req: str) -> PaymentRequest:
-    return await ln.decode_pay_request_impl(pay_req)
+    return await _IMPL.decode_pay_request(pay_req)
 
 
 async def new_address(input: NewAddressInput) -> str:
-    return await ln.new_address_impl(input)
+    return await _IMPL.new_address(input)
+
+
+async def _invalidate_wallet_balance_cache():
+    # A write just changed wallet state: drop every cached copy so the
+    # next read is fresh, and bump the version so an in-flight debounced
+    # update cannot overwrite newer state with a stale balance.
+    _CACHE["version"] += 1
+    _CACHE["wallet_balance"] = None
+    _ttl_cache.invalidate("wallet_balance")
+    await redis_plugin.redis.delete(_WALLET_BALANCE_REDIS_KEY)
 
 
 async def send_coins(input: SendCoinsInput) -> SendCoinsResponse:
-    res = await ln.send_coins_impl(input)
+    res = await _IMPL.send_coins(input)
+    await _invalidate_wallet_balance_cache()
     _schedule_wallet_balance_update()
     return res
 
@@ -124,13 +402,20 @@ async def send_payment(
     fee_limit_msat: int,
     amount_msat: Optional[int] = None,
 ) -> Payment:
-    res = await ln.send_payment_impl(
+    res = await _IMPL.send_payment(
         pay_req, timeout_seconds, fee_limit_msat, amount_msat
     )
+    await _invalidate_wallet_balance_cache()
     _schedule_wallet_balance_update()
     return res
 
 
+# pubkey@host:port - 66 hex chars for the compressed pubkey (LND also
+# accepts uppercase hex), the host part may be an IP address (bracketed
+# IPv6 included), a hostname or an onion address.
+_NODE_URI_RE = re.compile(r"^[0-9a-f]{66}@\[?[\w\.\-:]+\]?:\d+$", re.IGNORECASE)
+
+
 async def channel_open(
     local_funding_amount: int, node_URI: str, target_confs: int
 ) -> str:
@@ -144,37 +429,103 @@ async def channel_open(
     if len(node_URI) == 0:
         raise ValueError("node_URI cant be empty")
 
-    if not "@" in node_URI:
-        raise ValueError("node_URI must contain @ with node physical address")
+    if not _NODE_URI_RE.fullmatch(node_URI):
+        raise ValueError("node_URI must have the format pubkey@host:port")
 
-    res = await ln.channel_open_impl(local_funding_amount, node_URI, target_confs)
+    res = await _IMPL.channel_open(local_funding_amount, node_URI, target_confs)
+    await _invalidate_wallet_balance_cache()
     return res
 
 
 async def channel_list() -> List[Channel]:
-    res = await ln.channel_list_impl()
+    res = await _IMPL.channel_list()
     return res
 
 
 async def channel_close(channel_id: int, force_close: bool) -> str:
-    res = await ln.channel_close_impl(channel_id, force_close)
+    res = await _IMPL.channel_close(channel_id, force_close)
     return res
 
 
 async def get_ln_info() -> LnInfo:
-    ln_info = await ln.get_ln_info_impl()
+    ln_info = await _get_ln_info_cached()
     if PLATFORM == APIPlatform.RASPIBLITZ:
         ln_info.identity_uri = await redis_get("ln_default_address")
     return ln_info
 
 
 async def unlock_wallet(password: str) -> bool:
-    res = await ln.unlock_wallet_impl(password)
+    res = await _IMPL.unlock_wallet(password)
     return res
 
 
 async def get_fee_revenue() -> FeeRevenue:
-    return await ln.get_fee_revenue_impl()
+    return await _IMPL.get_fee_revenue()
+
+
+# Keep strong references to fire-and-forget tasks. The event loop only
+# holds weak references, so without this the GC may drop a running task.
+_background_tasks = set()
+
+
+def _create_task(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+_listener_supervisor: Optional[asyncio.Task] = None
+
+# A listener run at least this long counts as healthy and resets the
+# restart backoff.
+_SUPERVISOR_HEALTHY_SECONDS = 60.0
+
+
+async def _run_listener_supervisor():
+    """Keeps the lightning listeners alive.
+
+    Python 3.9 support rules out asyncio.TaskGroup, so this supervises
+    the listener tasks by hand: if one dies on a transient error, all of
+    them are torn down and restarted with exponential backoff.
+    """
+
+    listeners = (
+        _handle_info_listener,
+        _handle_invoice_listener,
+        _handle_forward_event_listener,
+        _handle_wallet_balance_subscription,
+    )
+
+    backoff = 1.0
+    while True:
+        tasks = [asyncio.create_task(listener()) for listener in listeners]
+        started = time.monotonic()
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for t in tasks:
+                t.cancel()
+            # Retrieve every exception - several listeners can fail in
+            # the same tick (e.g. both gRPC streams drop on a node
+            # restart) - and make sure the cancelled siblings have
+            # actually finished before fresh listeners are spawned.
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            errors = [r for r in results if isinstance(r, Exception)]
+            if errors:
+                raise errors[0]
+        except asyncio.CancelledError:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        except Exception as e:
+            if time.monotonic() - started > _SUPERVISOR_HEALTHY_SECONDS:
+                # The listeners ran fine for a while; treat this as a
+                # fresh incident instead of continuing an old backoff.
+                backoff = 1.0
+            logging.error(f"lightning listener failed, restarting in {backoff}s: {e}")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
 
 
 async def register_lightning_listener():
@@ -186,6 +537,8 @@ async def register_lightning_listener():
     It is the task of the caller to call register_lightning_listener() again
     """
 
+    global _listener_supervisor
+
     try:
 
         if ln_node == "" or ln_node == "none":
@@ -194,90 +547,177 @@ async def register_lightning_listener():
             )
             return
 
-        await ln.get_ln_info_impl()
+        if _listener_supervisor is not None and not _listener_supervisor.done():
+            logging.warning("Lightning listeners are already registered")
+            return
+
+        await _get_ln_info_coalesced()
 
-        loop = asyncio.get_event_loop()
-        loop.create_task(_handle_info_listener())
-        loop.create_task(_handle_invoice_listener())
-        loop.create_task(_handle_forward_event_listener())
+        _listener_supervisor = _create_task(_run_listener_supervisor())
     except NotImplementedError as r:
         raise HTTPException(status.HTTP_501_NOT_IMPLEMENTED, detail=r.args[0])
 
 
+async def unregister_lightning_listener():
+    """Cancels the listener supervisor and with it all listener tasks"""
+
+    global _listener_supervisor
+
+    if _listener_supervisor is None:
+        return
+
+    _listener_supervisor.cancel()
+    try:
+        await _listener_supervisor
+    except asyncio.CancelledError:
+        pass
+    _listener_supervisor = None
+
+
 async def _handle_info_listener():
-    last_info = None
-    last_info_lite = None
-    while True:
-        info = await ln.get_ln_info_impl()
+    last_lite_fp = None
 
-        if last_info != info:
-            await broadcast_sse_msg(SSE.LN_INFO, info.dict())
-            last_info = info
+    # Hoist everything the loop touches into locals. This loop runs for
+    # the lifetime of the process, so the LOAD_GLOBAL/LOAD_ATTR savings
+    # add up.
+    broadcast = broadcast_sse_msg
+    event_info = SSE.LN_INFO
+    event_info_lite = SSE.LN_INFO_LITE
 
-        info_lite = LightningInfoLite.from_lninfo(info)
+    # The backend generators suspend their own polling while no SSE
+    # client is connected (see listen_info_impl) and only yield when the
+    # node actually reports a change, so every iteration here has an
+    # audience and is a real update.
+    async for info in _IMPL.listen_info():
+        # Serialize once, fan out the same payload to every client.
+        await broadcast(event_info, info.json())
 
-        if last_info_lite != info_lite:
-            await broadcast_sse_msg(SSE.LN_INFO_LITE, info_lite.dict())
-            last_info_lite = info_lite
+        info_lite = _lninfo_to_lite(info)
 
-        await asyncio.sleep(GATHER_INFO_INTERVALL)
+        # An integer compare instead of the field-by-field model __eq__.
+        lite_fp = info_lite.fingerprint()
+        if last_lite_fp != lite_fp:
+            await broadcast(event_info_lite, info_lite.json())
+            last_lite_fp = lite_fp
 
 
 async def _handle_invoice_listener():
-    async for i in ln.listen_invoices():
-        await broadcast_sse_msg(SSE.LN_INVOICE_STATUS, i.dict())
+    async for i in _IMPL.listen_invoices():
+        await broadcast_sse_msg(SSE.LN_INVOICE_STATUS, i.json())
         _schedule_wallet_balance_update()
 
 
-_fwd_update_scheduled = False
-_fwd_successes = []
+# Upper bound for buffered forward events between two SSE updates.
+# Protects against unbounded memory growth during a forward burst.
+_FWD_MAX_BUFFERED = 10_000
 
+_fwd_flush_handle: Optional[asyncio.TimerHandle] = None
+_fwd_successes: deque = deque(maxlen=_FWD_MAX_BUFFERED)
 
-async def _handle_forward_event_listener():
-    async def _schedule_fwd_update():
-        global _fwd_update_scheduled
-        global _fwd_successes
 
-        _fwd_update_scheduled = True
+async def _flush_fwd_updates():
+    global _fwd_flush_handle
+    global _fwd_successes
 
-        await asyncio.sleep(FWD_GATHER_INTERVAL)
+    try:
+        # Nobody is connected: hold the flush instead of fetching fee
+        # revenue for no one. The deque keeps absorbing events, bounded
+        # by its maxlen.
+        await subscribers_present.wait()
 
         if len(_fwd_successes) > 0:
-            l = _fwd_successes
-            _fwd_successes = []
-            await broadcast_sse_msg(SSE.LN_FORWARD_SUCCESSES, l)
+            # Atomic hand-off: rebind a fresh deque and broadcast the
+            # old one, no Python-level copy of a growing buffer.
+            batch = _fwd_successes
+            _fwd_successes = deque(maxlen=_FWD_MAX_BUFFERED)
+            await broadcast_sse_msg(SSE.LN_FORWARD_SUCCESSES, list(batch))
 
         _schedule_wallet_balance_update()
         rev = await get_fee_revenue()
-        await broadcast_sse_msg(SSE.LN_FEE_REVENUE, rev.dict())
+        await broadcast_sse_msg(SSE.LN_FEE_REVENUE, rev.json())
+    finally:
+        _fwd_flush_handle = None
+
+
+def _schedule_fwd_update():
+    # Unlike the old boolean, which was only set once the spawned task
+    # got to run, the handle is assigned before control can leave this
+    # function - two events can never schedule two flushes.
+    global _fwd_flush_handle
+
+    if _fwd_flush_handle is not None:
+        return
+
+    loop = asyncio.get_running_loop()
+    _fwd_flush_handle = loop.call_later(
+        FWD_GATHER_INTERVAL, lambda: _create_task(_flush_fwd_updates())
+    )
+
+
+async def _handle_forward_event_listener():
+    if ENABLE_FWD_NOTIFICATIONS:
+        async for i in _IMPL.listen_forward_events():
+            _fwd_successes.append(i)
+            _schedule_fwd_update()
+    else:
+        # Notifications are off: never serialize or buffer the event,
+        # only keep the fee revenue / wallet balance updates flowing.
+        async for i in _IMPL.listen_forward_events():
+            _schedule_fwd_update()
+
+
+# Gap between a triggering event and the actual balance fetch. All
+# triggers that arrive inside the window coalesce into a single update.
+_WALLET_BALANCE_THROTTLE_SECONDS = 1.1
+
+_wallet_throttle_handle: Optional[asyncio.TimerHandle] = None
+
+
+async def _handle_wallet_balance_subscription():
+    # Every worker rebroadcasts published balance updates to its own
+    # SSE clients, no matter which worker fetched the value.
+    pubsub = redis_plugin.redis.pubsub()
+    await pubsub.subscribe(_WALLET_BALANCE_REDIS_CHANNEL)
+
+    async for msg in pubsub.listen():
+        if msg["type"] != "message":
+            continue
+
+        payload = msg["data"]
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8")
 
-        _fwd_update_scheduled = False
+        _CACHE["wallet_balance"] = payload
+        await broadcast_sse_msg(SSE.WALLET_BALANCE, payload)
 
-    async for i in ln.listen_forward_events():
-        if ENABLE_FWD_NOTIFICATIONS:
-            _fwd_successes.append(i.dict())
 
-        if not _fwd_update_scheduled:
-            loop = asyncio.get_event_loop()
-            loop.create_task(_schedule_fwd_update())
+async def _do_wallet_balance_update():
+    global _wallet_throttle_handle
+    _wallet_throttle_handle = None
 
+    version = _CACHE["version"]
+    wb = await _IMPL.get_wallet_balance()
+    if version != _CACHE["version"]:
+        # A newer write superseded this fetch while it was in flight;
+        # the update it scheduled will broadcast the current balance.
+        return
 
-_wallet_balance_update_scheduled = False
+    payload = wb.json()
+    if _CACHE["wallet_balance"] != payload:
+        redis = redis_plugin.redis
+        await redis.set(
+            _WALLET_BALANCE_REDIS_KEY, payload, ex=_WALLET_BALANCE_REDIS_TTL
+        )
+        await redis.publish(_WALLET_BALANCE_REDIS_CHANNEL, payload)
 
 
 def _schedule_wallet_balance_update():
-    async def _perform_update():
-        global _wallet_balance_update_scheduled
-        _wallet_balance_update_scheduled = True
-        await asyncio.sleep(1.1)
-        wb = await ln.get_wallet_balance_impl()
-        if _CACHE["wallet_balance"] != wb:
-            await broadcast_sse_msg(SSE.WALLET_BALANCE, wb.dict())
-            _CACHE["wallet_balance"] = wb
-
-        _wallet_balance_update_scheduled = False
-
-    global _wallet_balance_update_scheduled
-    if not _wallet_balance_update_scheduled:
-        loop = asyncio.get_event_loop()
-        loop.create_task(_perform_update())
+    # A single timer handle is the whole throttle state - no closure is
+    # compiled and no task is created until the timer actually fires.
+    global _wallet_throttle_handle
+    if _wallet_throttle_handle is None:
+        loop = asyncio.get_running_loop()
+        _wallet_throttle_handle = loop.call_later(
+            _WALLET_BALANCE_THROTTLE_SECONDS,
+            lambda: _create_task(_do_wallet_balance_update()),
+        )
@@ -35,7 +35,8 @@ from app.models.lightning import (
     WalletBalance,
 )
 from app.repositories.bitcoin_utils import bitcoin_rpc_async
-from app.utils import config_get_hex_str, next_push_id
+from app.settings import get_settings
+from app.utils import config_get_hex_str, next_push_id, subscribers_present
 
 _cln_grpc_cert = bytes.fromhex(
     config_get_hex_str(config("cln_grpc_cert"), name="cln_grpc_cert")
@@ -677,13 +678,35 @@ async def listen_invoices() -> AsyncGenerator[Invoice, None]:
         yield i
 
 
+async def listen_info_impl() -> AsyncGenerator[LnInfo, None]:
+    logging.debug(f"CLN_GRPC: listen_info_impl()")
+
+    # CLN has no suitable subscription for node info changes.
+    # We must poll instead, but only yield when something changed.
+
+    interval = get_settings().gather_ln_info_interval
+
+    last_fp = None
+    while True:
+        # Zero gRPC traffic while no SSE client is connected; the poll
+        # resumes with the first subscriber.
+        await subscribers_present.wait()
+
+        info = await get_ln_info_impl()
+        fp = info.fingerprint()
+        if last_fp != fp:
+            yield info
+            last_fp = fp
+        await asyncio.sleep(interval)
+
+
 async def listen_forward_events() -> ForwardSuccessEvent:
     logging.debug(f"CLN_GRPC: listen_forward_events()")
 
     # CLN has no subscription to forwarded events.
     # We must poll instead.
 
-    interval = config("gather_ln_info_interval", default=2, cast=float)
+    interval = get_settings().gather_ln_info_interval
 
     # make sure we know how many forwards we have
     # we need to calculate the difference between each iteration
@@ -33,7 +33,8 @@ from app.models.lightning import (
     SendCoinsResponse,
     WalletBalance,
 )
-from app.utils import SSE, broadcast_sse_msg, config_get_hex_str
+from app.settings import get_settings
+from app.utils import SSE, broadcast_sse_msg, config_get_hex_str, subscribers_present
 
 _lnd_connect_error_debug_msg = """
 LND_GRPC: Unable to connect to LND. Possible reasons:
@@ -497,7 +498,7 @@ async def send_coins_impl(input: SendCoinsInput) -> SendCoinsResponse:
 
         response = await _lnd_stub.SendCoins(r)
         r = SendCoinsResponse.from_lnd_grpc(response, input)
-        await broadcast_sse_msg(SSE.LN_ONCHAIN_PAYMENT_STATUS, r.dict())
+        await broadcast_sse_msg(SSE.LN_ONCHAIN_PAYMENT_STATUS, r)
         return r
     except grpc.aio._call.AioRpcError as error:
         _check_if_locked()
@@ -534,7 +535,7 @@ async def send_payment_impl(
         p = None
         async for response in _router_stub.SendPaymentV2(r):
             p = Payment.from_lnd_grpc(response)
-            await broadcast_sse_msg(SSE.LN_PAYMENT_STATUS, p.dict())
+            await broadcast_sse_msg(SSE.LN_PAYMENT_STATUS, p)
         return p
     except grpc.aio._call.AioRpcError as error:
         _check_if_locked(error)
@@ -678,6 +679,48 @@ async def listen_invoices() -> Invoice:
         )
 
 
+async def listen_info_impl() -> AsyncGenerator[LnInfo, None]:
+    logging.debug(f"LND_GRPC: listen_info_impl()")
+
+    interval = get_settings().gather_ln_info_interval
+    wake_up = asyncio.Event()
+
+    async def _watch_channel_events():
+        try:
+            req = ln.ChannelEventSubscription()
+            async for _ in _lnd_stub.SubscribeChannelEvents(req):
+                wake_up.set()
+        except grpc.aio._call.AioRpcError as error:
+            # The subscription is only a wake-up hint for the poll below,
+            # a failed stream must not kill the generator.
+            logging.debug(f"LND_GRPC: SubscribeChannelEvents failed: {error.details()}")
+
+    watcher = asyncio.create_task(_watch_channel_events())
+
+    last_fp = None
+    try:
+        while True:
+            # Zero gRPC traffic while no SSE client is connected; the
+            # poll resumes with the first subscriber.
+            await subscribers_present.wait()
+
+            info = await get_ln_info_impl()
+            fp = info.fingerprint()
+            if last_fp != fp:
+                yield info
+                last_fp = fp
+
+            # Wake up early when a channel event fires, otherwise poll
+            # at the coarse interval.
+            try:
+                await asyncio.wait_for(wake_up.wait(), timeout=interval)
+                wake_up.clear()
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        watcher.cancel()
+
+
 async def listen_forward_events() -> ForwardSuccessEvent:
     logging.debug(f"LND_GRPC: listen_forward_events()")
 
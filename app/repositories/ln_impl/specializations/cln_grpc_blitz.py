@@ -276,6 +276,15 @@ async def listen_invoices() -> AsyncGenerator[Invoice, None]:
         raise
 
 
+async def listen_info_impl() -> AsyncGenerator[LnInfo, None]:
+    try:
+        async for i in cln_main.listen_info_impl():
+            yield i
+    except:
+        _check_if_locked()
+        raise
+
+
 async def listen_forward_events() -> ForwardSuccessEvent:
     try:
         async for e in cln_main.listen_forward_events():
@@ -1,7 +1,6 @@
 import logging
 import secrets
 
-from decouple import config
 from fastapi import APIRouter, HTTPException, Request, Response, status
 from fastapi.params import Depends
 
@@ -26,8 +25,11 @@ from app.routers.system_docs import (
     get_debug_logs_raw_summary,
     get_hw_info_json,
 )
+from app.settings import get_settings
 from app.utils import SSE, call_script, parse_key_value_text
 
+_settings = get_settings()
+
 _PREFIX = "system"
 
 router = APIRouter(prefix=f"/{_PREFIX}", tags=["System"])
@@ -42,10 +44,8 @@ router = APIRouter(prefix=f"/{_PREFIX}", tags=["System"])
 )
 async def login(i: LoginInput, response: Response):
 
-    platform = ""
-    try:
-        platform = config("platform", cast=str)
-    except:
+    platform = _settings.platform
+    if platform == "":
         logging.warning(f"please set platform in env config file")
 
     if platform == "raspiblitz":
@@ -62,7 +62,7 @@ async def login(i: LoginInput, response: Response):
                 return tokenObj
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Password is wrong")
     else:
-        match = secrets.compare_digest(i.password, config("login_password", cast=str))
+        match = secrets.compare_digest(i.password, _settings.login_password)
         if match:
             token = sign_jwt().get("access_token")
             response.set_cookie("access_token", token)
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+from decouple import config
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable snapshot of the decouple-backed configuration.
+
+    decouple consults its repository on every config() call; reading the
+    values once turns repeated lookups into plain attribute reads and
+    gives tests a single object to override instead of monkeypatching
+    decouple itself.
+    """
+
+    platform: str
+    ln_node: str
+    login_password: str
+    gather_ln_info_interval: float
+    sse_notify_forward_successes: bool
+    forwards_gather_interval: float
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    return Settings(
+        platform=config("platform", default="", cast=str),
+        ln_node=config("ln_node"),
+        login_password=config("login_password", default="", cast=str),
+        gather_ln_info_interval=config(
+            "gather_ln_info_interval", default=2, cast=float
+        ),
+        sse_notify_forward_successes=config(
+            "sse_notify_forward_successes", default=False, cast=bool
+        ),
+        forwards_gather_interval=config(
+            "forwards_gather_interval", default=2.0, cast=float
+        ),
+    )
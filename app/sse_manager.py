@@ -14,6 +14,11 @@ class SSEManager:
     _connections = {}
     _sse_queue = asyncio.Queue()
 
+    # Set while at least one client is connected. Background gatherers
+    # that only produce SSE traffic can wait on this instead of polling
+    # for nobody.
+    subscribers_present = asyncio.Event()
+
     def setup(self) -> None:
         if self._setup_finished:
             raise RuntimeError("SSEManager setup must not be called twice")
@@ -27,9 +32,15 @@ class SSEManager:
         id = self._num_connections
         self._num_connections += 1
         self._connections[id] = q
+        self.subscribers_present.set()
         event_source = EventSourceResponse(self._subscribe(request, id, q))
         return (event_source, id)
 
+    def _remove_connection(self, id: int) -> None:
+        self._connections.pop(id, None)
+        if not self._connections:
+            self.subscribers_present.clear()
+
     async def send_to_single(self, id: int, data: ServerSentEvent):
         await self._connections[id].put(data)
 
@@ -41,7 +52,7 @@ class SSEManager:
             while True:
                 if await request.is_disconnected():
                     logger.info(f"Client with ID {id} has disconnected")
-                    self._connections.pop(id)
+                    self._remove_connection(id)
                     await request.close()
                     break
                 else:
@@ -49,7 +60,7 @@ class SSEManager:
                     yield data
         except asyncio.CancelledError as e:
             logger.info(f"CancelledError on client with ID {id}: {e}")
-            self._connections.pop(id)
+            self._remove_connection(id)
             await request.close()
 
     async def _broadcast_data_sse(self):
@@ -1,6 +1,5 @@
 import array
 import asyncio
-import json
 import logging
 import os
 import random
@@ -9,8 +8,10 @@ import time
 import warnings
 from typing import Dict, Optional
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from fastapi_plugins import redis_plugin
+from pydantic import BaseModel
 
 from app.external.sse_starlette import ServerSentEvent
 from app.sse_manager import SSEManager
@@ -18,6 +19,9 @@ from app.sse_manager import SSEManager
 sse_mgr = SSEManager()
 sse_mgr.setup()
 
+# Set while at least one SSE client is connected, see SSEManager.
+subscribers_present = sse_mgr.subscribers_present
+
 
 class ProcessResult:
     return_code: int
@@ -33,10 +37,86 @@ class ProcessResult:
         return f"ProcessResult: \nreturn_code: {self.return_code} \nstdout: {self.stdout} \nstderr: {self.stderr}"
 
 
+class TTLCache:
+    """Small per-process cache with request coalescing.
+
+    Values are kept for a caller-supplied TTL. Concurrent callers for
+    the same key share a single in-flight load instead of each issuing
+    their own request.
+    """
+
+    def __init__(self) -> None:
+        self._entries = {}  # key -> (expires_at, value)
+        self._inflight = {}  # key -> asyncio.Future
+
+    async def get(self, key: str, loader, ttl: float):
+        """Return the cached value for key, loading it via loader() if
+        it is missing or expired.
+
+        :param str key: the cache key
+        :param loader: argument-less coroutine function producing the value
+        :param float ttl: seconds the loaded value stays fresh
+        """
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        fut = self._inflight.get(key)
+        if fut is not None:
+            # shield: a cancelled waiter must not cancel the shared
+            # future under the leader's feet.
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            value = await loader()
+        except BaseException as e:
+            # BaseException: when the leading caller is cancelled the
+            # future must still be resolved, otherwise every coalesced
+            # waiter hangs forever.
+            if not fut.done():
+                fut.set_exception(e)
+                # mark the exception as retrieved in case no one is waiting
+                fut.exception()
+            raise
+        else:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            if not fut.done():
+                fut.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+def _orjson_default(o):
+    if isinstance(o, BaseModel):
+        # Hand orjson the raw field values instead of .dict(): orjson
+        # recurses into them itself and calls back here for nested
+        # models, saving a full Python tree walk per payload.
+        return o.__dict__
+    return jsonable_encoder(o)
+
+
 def build_sse_event(event: str, json_data: Optional[Dict]):
+    # Pre-serialized payloads (pydantic model.json() output) are passed
+    # through as-is; everything else - models included - is encoded
+    # here. Serializing once keeps the JSON work O(1) instead of
+    # O(#subscribers).
+    if isinstance(json_data, bytes):
+        data = json_data.decode("utf-8")
+    elif isinstance(json_data, str):
+        data = json_data
+    else:
+        data = orjson.dumps(json_data, default=_orjson_default).decode("utf-8")
+
     return ServerSentEvent(
         event=event,
-        data=json.dumps(jsonable_encoder(json_data)),
+        data=data,
     )
 
 
@@ -47,7 +127,7 @@ async def broadcast_sse_msg(event: str, json_data: Optional[Dict]):
     ----------
     event : str
         The SSE event
-    data : dictionary, optional
+    data : dictionary or pre-serialized JSON str / bytes, optional
         The data to include
     """
 
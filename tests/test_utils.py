@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from app.utils import TTLCache
+
+
+def test_ttl_cache_coalesces_concurrent_loads():
+    async def run():
+        cache = TTLCache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(
+            cache.get("k", loader, 1.0), cache.get("k", loader, 1.0)
+        )
+
+        assert results == ["value", "value"]
+        assert calls == 1
+
+    asyncio.run(run())
+
+
+def test_ttl_cache_expires_entries():
+    async def run():
+        cache = TTLCache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await cache.get("k", loader, 0.01) == 1
+        assert await cache.get("k", loader, 0.01) == 1
+        await asyncio.sleep(0.02)
+        assert await cache.get("k", loader, 0.01) == 2
+
+    asyncio.run(run())
+
+
+def test_ttl_cache_invalidate():
+    async def run():
+        cache = TTLCache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await cache.get("k", loader, 1.0) == 1
+        cache.invalidate("k")
+        assert await cache.get("k", loader, 1.0) == 2
+
+    asyncio.run(run())
+
+
+def test_ttl_cache_follower_cancellation_does_not_break_leader():
+    async def run():
+        cache = TTLCache()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def loader():
+            started.set()
+            await release.wait()
+            return "value"
+
+        leader = asyncio.create_task(cache.get("k", loader, 1.0))
+        await started.wait()
+        follower = asyncio.create_task(cache.get("k", loader, 1.0))
+        await asyncio.sleep(0)
+
+        follower.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        # The leader must not trip over the cancelled follower when it
+        # resolves the shared future.
+        assert await asyncio.wait_for(leader, timeout=1) == "value"
+
+    asyncio.run(run())
+
+
+def test_ttl_cache_leader_cancellation_releases_waiters():
+    async def run():
+        cache = TTLCache()
+        started = asyncio.Event()
+
+        async def loader():
+            started.set()
+            await asyncio.sleep(60)
+
+        leader = asyncio.create_task(cache.get("k", loader, 1.0))
+        await started.wait()
+        follower = asyncio.create_task(cache.get("k", loader, 1.0))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        # The follower must not hang once the leader is gone.
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(follower, timeout=1)
+
+    asyncio.run(run())